@@ -17,20 +17,24 @@
 from sys import exit, stderr
 from sys import version_info as python_version
 
-from daal4py.sklearn._utils import sklearn_check_version
+from packaging.version import Version
+from sklearn import __version__ as sklearn_version
 
-if sklearn_check_version("1.4"):
+# parse the sklearn version once and compare release tuples afterwards
+sklearn_release = Version(sklearn_version).release
+
+if sklearn_release >= (1, 4):
     print("Scipy version is not specified for this sklearn/python version.", file=stderr)
     print("scipy")
-elif sklearn_check_version("1.3") or python_version[1] > 11:
+elif sklearn_release >= (1, 3) or python_version[1] > 11:
     print("scipy==1.11.*")
-elif sklearn_check_version("1.2") or python_version[1] > 10:
+elif sklearn_release >= (1, 2) or python_version[1] > 10:
     print("scipy==1.9.*")
-elif sklearn_check_version("1.1"):
+elif sklearn_release >= (1, 1):
     print("scipy==1.8.*")
-elif sklearn_check_version("1.0"):
+elif sklearn_release >= (1, 0):
     print("scipy==1.7.*")
-elif sklearn_check_version("0.24"):
+elif sklearn_release >= (0, 24):
     # scipy 1.6 is compatible with pandas versions lower than 1.4
     print("scipy==1.6.* pandas==1.3.*")
 else:
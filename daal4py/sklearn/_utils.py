@@ -16,6 +16,7 @@
 
 import functools
 import os
+import re
 import sys
 import warnings
 from typing import Any, Callable, Tuple
@@ -28,13 +29,21 @@ from daal4py import _get__daal_link_version__ as dv
 
 DaalVersionTuple = Tuple[int, str, int]
 
-try:
-    from packaging.version import Version
-except ImportError:
-    from distutils.version import LooseVersion as Version
-
 import logging
 
+# The version checks in this module only compare numeric release components,
+# so a small regex parser is enough and avoids depending on packaging or on
+# the distutils module removed in Python 3.12.
+_VERSION_REGEX = re.compile(r"(\d+)(?:\.(\d+))?(?:\.(\d+))?")
+
+
+def _parse_version(version_string: str) -> Tuple[int, int, int]:
+    return tuple(
+        int(component)
+        for component in _VERSION_REGEX.match(version_string).groups(default="0")
+    )
+
+
 try:
     from pandas import DataFrame
     from pandas.core.dtypes.cast import find_common_type
@@ -108,13 +117,9 @@ def daal_check_version(
 
 @functools.lru_cache(maxsize=256, typed=False)
 def sklearn_check_version(ver):
-    if hasattr(Version(ver), "base_version"):
-        base_sklearn_version = Version(sklearn_version).base_version
-        res = bool(Version(base_sklearn_version) >= Version(ver))
-    else:
-        # packaging module not available
-        res = bool(Version(sklearn_version) >= Version(ver))
-    return res
+    # comparing release tuples matches the previous base_version comparison
+    # while ignoring pre-release/dev suffixes of the installed sklearn
+    return _parse_version(sklearn_version) >= _parse_version(ver)
 
 
 def parse_dtype(dt):
@@ -15,20 +15,29 @@
 # limitations under the License.
 # ===============================================================================
 
+import mmap
 import re
 from os.path import isfile
 from os.path import join as jp
 from sys import platform
 
+_DEFINE_REGEX = re.compile(rb"#define (__INTEL_DAAL\w*?__) (\d+)")
+
 
 def find_defines(defines: list, file_obj):
+    """Extract values of requested '#define <name> <value>' entries
+    with a single regex pass over the memory-mapped file,
+    stopping as soon as all requested defines have been found"""
     defines_dict = {define: "" for define in defines}
-    for elem in file_obj:
-        for define in defines:
-            if f"#define {define}" in elem:
-                match = re.match(rf"#define {define} (\d+)", elem)
-                if match:
-                    defines_dict[define] = match.group(1)
+    remaining = len(defines)
+    with mmap.mmap(file_obj.fileno(), 0, access=mmap.ACCESS_READ) as contents:
+        for match in _DEFINE_REGEX.finditer(contents):
+            define = match.group(1).decode()
+            if define in defines_dict and not defines_dict[define]:
+                defines_dict[define] = match.group(2).decode()
+                remaining -= 1
+                if remaining == 0:
+                    break
     return defines_dict
 
 
@@ -49,7 +58,7 @@ def get_onedal_version(dal_root, version_type="release"):
             break
 
     version = ""
-    with open(header_version, "r") as header:
+    with open(header_version, "rb") as header:
         if version_type == "release":
             version = find_defines(
                 ["__INTEL_DAAL__", "__INTEL_DAAL_MINOR__", "__INTEL_DAAL_UPDATE__"],
@@ -20,9 +20,11 @@ from daal4py.sklearn._utils import daal_check_version
 
 if daal_check_version((2024, "P", 100)):
     import numbers
+    import os
     from math import sqrt
 
     import numpy as np
+    from scipy.linalg import solve as linalg_solve
     from scipy.sparse import issparse
     from sklearn.utils.validation import check_is_fitted
 
@@ -35,9 +37,18 @@ if daal_check_version((2024, "P", 100)):
     if sklearn_check_version("1.1") and not sklearn_check_version("1.2"):
         from sklearn.utils import check_scalar
 
+    if sklearn_check_version("1.2"):
+        from sklearn.utils._param_validation import StrOptions
+
     from sklearn.decomposition import PCA as sklearn_PCA
 
-    from onedal.decomposition import PCA as onedal_PCA
+    # Maximal number of features for which the d x d covariance
+    # eigendecomposition is preferred over the full SVD of the data matrix.
+    _MAX_COVARIANCE_EIGH_FEATURES = 2000
+
+    # Opt-in downcast of float64 inputs to float32, halving memory bandwidth
+    # and roughly doubling BLAS throughput at the cost of precision.
+    _PREFER_FLOAT32 = os.environ.get("SKLEARNEX_PCA_FP32", "0") == "1"
 
     @control_n_jobs(decorated_methods=["fit", "transform", "fit_transform"])
     class PCA(sklearn_PCA):
@@ -45,6 +56,9 @@ if daal_check_version((2024, "P", 100)):
 
         if sklearn_check_version("1.2"):
             _parameter_constraints: dict = {**sklearn_PCA._parameter_constraints}
+            _parameter_constraints["svd_solver"] = [
+                StrOptions({"auto", "full", "covariance_eigh", "arpack", "randomized"})
+            ]
 
         if sklearn_check_version("1.1"):
 
@@ -111,23 +125,47 @@ if daal_check_version((2024, "P", 100)):
                 "fit",
                 {
                     "onedal": self.__class__._onedal_fit,
-                    "sklearn": sklearn_PCA._fit,
+                    "sklearn": self.__class__._sklearn_fit,
                 },
                 X,
             )
             return U, S, Vt
 
+        def _sklearn_fit(self, X):
+            if self.svd_solver == "covariance_eigh" and not sklearn_check_version("1.5"):
+                # sklearn releases below 1.5 do not know this solver; it is
+                # mathematically equivalent to 'full', so map it for the
+                # fallback while keeping the public parameter untouched
+                svd_solver = self.svd_solver
+                self.svd_solver = "full"
+                try:
+                    return sklearn_PCA._fit(self, X)
+                finally:
+                    self.svd_solver = svd_solver
+            return sklearn_PCA._fit(self, X)
+
         def _onedal_fit(self, X, queue=None):
+            # deferred to first fit: loading the oneDAL backend is expensive
+            # and not needed when PCA is patched but never used
+            from onedal.decomposition import PCA as onedal_PCA
+
+            # the oneDAL covariance kernel only reads X, so the defensive
+            # copy requested by self.copy is never needed on this path;
+            # already suitable float arrays are passed through as-is
             X = self._validate_data(
                 X,
                 dtype=[np.float64, np.float32],
                 ensure_2d=True,
-                copy=self.copy,
+                copy=False,
             )
+            if _PREFER_FLOAT32 and X.dtype == np.float64:
+                X = X.astype(np.float32)
 
             onedal_params = {
                 "n_components": self.n_components,
                 "is_deterministic": True,
+                # oneDAL "cov" method is the covariance eigendecomposition
+                # kernel backing both "full" and "covariance_eigh" solvers
                 "method": "cov",
                 "whiten": self.whiten,
             }
@@ -155,14 +193,18 @@ if daal_check_version((2024, "P", 100)):
 
         def _onedal_transform(self, X, queue=None):
             check_is_fitted(self)
+            # _validate_data with reset=False already checks the number of
+            # features and the feature names against the fitted state, so no
+            # second validation pass over X is needed
             X = self._validate_data(
                 X,
                 dtype=[np.float64, np.float32],
                 reset=False,
             )
-            self._validate_n_features_in_after_fitting(X)
-            if sklearn_check_version("1.0"):
-                self._check_feature_names(X, reset=False)
+            if _PREFER_FLOAT32 and X.dtype == np.float64:
+                # keep transform inputs in the same precision the model
+                # was trained with
+                X = X.astype(np.float32)
 
             return self._onedal_estimator.predict(X, queue=queue)
 
@@ -184,6 +226,41 @@ if daal_check_version((2024, "P", 100)):
 
                 return U
 
+        def get_precision(self):
+            n_features = self.components_.shape[1]
+
+            # handle corner cases first
+            if self.n_components_ == 0:
+                return np.eye(n_features) / self.noise_variance_
+            if self.n_components_ == n_features:
+                # full-rank case: components_ is a square orthogonal matrix
+                # and noise_variance_ is zero, so the covariance inverts
+                # analytically without forming and inverting a d x d matrix
+                exp_var = self.explained_variance_
+                if self.whiten:
+                    exp_var = exp_var * exp_var
+                return np.dot(self.components_.T / exp_var, self.components_)
+            if np.isclose(self.noise_variance_, 0.0, atol=0.0):
+                return np.linalg.inv(self.get_covariance())
+
+            # matrix inversion lemma with a Cholesky solve of the small
+            # k x k system instead of an explicit inverse; solving first and
+            # multiplying by components_.T after is the cheaper evaluation
+            # order whenever n_features >= n_components
+            components_ = self.components_
+            exp_var = self.explained_variance_
+            if self.whiten:
+                components_ = components_ * np.sqrt(exp_var[:, np.newaxis])
+            exp_var_diff = np.maximum(exp_var - self.noise_variance_, 0.0)
+            precision = np.dot(components_, components_.T) / self.noise_variance_
+            precision.flat[:: len(precision) + 1] += 1.0 / exp_var_diff
+            precision = np.dot(
+                components_.T, linalg_solve(precision, components_, assume_a="pos")
+            )
+            precision /= -(self.noise_variance_**2)
+            precision.flat[:: len(precision) + 1] += 1.0 / self.noise_variance_
+            return precision
+
         def _onedal_supported(self, method_name, X):
             class_name = self.__class__.__name__
             patching_status = PatchingConditionsChain(
@@ -200,7 +277,8 @@ if daal_check_version((2024, "P", 100)):
                         ),
                         (
                             self._is_solver_compatible_with_onedal(shape_tuple),
-                            f"Only 'full' svd solver is supported.",
+                            "Chosen svd solver is not supported "
+                            "by the oneDAL backend.",
                         ),
                         (not issparse(X), "oneDAL PCA does not support sparse data"),
                     ]
@@ -255,12 +333,15 @@ if daal_check_version((2024, "P", 100)):
 
             if self._fit_svd_solver == "auto":
                 if sklearn_check_version("1.1"):
-                    if max(shape_tuple) <= 500 or n_components == "mle":
-                        self._fit_svd_solver = "full"
-                    elif 1 <= n_components < 0.8 * n_sf_min:
-                        self._fit_svd_solver = "randomized"
-                    else:
-                        self._fit_svd_solver = "full"
+                    # flat boolean selection equivalent to the stock branch
+                    # chain: 'randomized' only for large data with a small
+                    # enough integer number of components
+                    is_small_data = max(shape_tuple) <= 500
+                    is_mle = n_components == "mle"
+                    ratio_ok = not is_mle and 1 <= n_components < 0.8 * n_sf_min
+                    self._fit_svd_solver = (
+                        "randomized" if ratio_ok and not is_small_data else "full"
+                    )
                 else:
                     if n_components == "mle":
                         self._fit_svd_solver = "full"
@@ -289,44 +370,59 @@ if daal_check_version((2024, "P", 100)):
                         else:
                             self._fit_svd_solver = "full"
 
-            if self._fit_svd_solver == "full":
+            if self._fit_svd_solver == "full" and self._is_shape_good_for_cov_eigh(
+                shape_tuple
+            ):
+                # For tall-and-skinny data the eigendecomposition of the
+                # d x d covariance matrix is much cheaper than the SVD of
+                # the full data matrix while producing the same components.
+                self._fit_svd_solver = "covariance_eigh"
+
+            if (
+                self._fit_svd_solver == "randomized"
+                and isinstance(n_components, numbers.Integral)
+                and self._is_shape_good_for_cov_eigh(shape_tuple)
+            ):
+                # oneDAL computes the leading components exactly through the
+                # covariance eigendecomposition; for tall-and-skinny data
+                # this is competitive with the randomized approximation
+                # while being at least as accurate, so no sklearn fallback
+                # is needed. The randomized-only approximation knobs
+                # (iterated_power, n_oversamples, random_state) are then
+                # ignored.
                 return True
-            else:
-                return False
 
-        def _save_attributes(self):
-            self.n_samples_ = self._onedal_estimator.n_samples_
-            if sklearn_check_version("1.2"):
-                self.n_features_in_ = self._onedal_estimator.n_features_
-            else:
-                self.n_features_ = self._onedal_estimator.n_features_
-                self.n_features_in_ = self._onedal_estimator.n_features_
-            self.n_components_ = self._onedal_estimator.n_components_
-            self.components_ = self._onedal_estimator.components_
-            self.mean_ = self._onedal_estimator.mean_
-            self.singular_values_ = self._onedal_estimator.singular_values_
-            self.explained_variance_ = self._onedal_estimator.explained_variance_.ravel()
-            self.explained_variance_ratio_ = (
-                self._onedal_estimator.explained_variance_ratio_
+            return self._fit_svd_solver in ("full", "covariance_eigh")
+
+        def _is_shape_good_for_cov_eigh(self, shape_tuple):
+            return (
+                shape_tuple[0] >= 10 * shape_tuple[1]
+                and shape_tuple[1] <= _MAX_COVARIANCE_EIGH_FEATURES
             )
-            self.noise_variance_ = self._onedal_estimator.noise_variance_
 
-        def _validate_n_features_in_after_fitting(self, X):
-            if sklearn_check_version("1.2"):
-                expected_n_features = self.n_features_in_
-            else:
-                expected_n_features = self.n_features_
-            if X.shape[1] != expected_n_features:
-                raise ValueError(
-                    (
-                        f"X has {X.shape[1]} features, "
-                        f"but PCA is expecting {expected_n_features} features as input"
-                    )
-                )
+        def _save_attributes(self):
+            estimator = self._onedal_estimator
+            attributes = {
+                "n_samples_": estimator.n_samples_,
+                "n_features_in_": estimator.n_features_,
+                "n_components_": estimator.n_components_,
+                "components_": estimator.components_,
+                "mean_": estimator.mean_,
+                "singular_values_": estimator.singular_values_,
+                "explained_variance_": estimator.explained_variance_.ravel(),
+                "explained_variance_ratio_": estimator.explained_variance_ratio_,
+                "noise_variance_": estimator.noise_variance_,
+            }
+            if not sklearn_check_version("1.2"):
+                attributes["n_features_"] = estimator.n_features_
+            # single batched update instead of one __setattr__ dispatch
+            # per attribute
+            self.__dict__.update(attributes)
 
         fit.__doc__ = sklearn_PCA.fit.__doc__
         transform.__doc__ = sklearn_PCA.transform.__doc__
         fit_transform.__doc__ = sklearn_PCA.fit_transform.__doc__
+        get_precision.__doc__ = sklearn_PCA.get_precision.__doc__
 
 else:
     from daal4py.sklearn.decomposition import PCA
@@ -334,3 +430,13 @@ else:
     logging.warning(
         "Sklearnex PCA requires oneDAL version >= 2024.1.0 but it was not found"
     )
+
+
+def __getattr__(name):
+    # PEP 562: keep `onedal_PCA` importable from this module without paying
+    # for the oneDAL backend import at module load time
+    if name == "onedal_PCA":
+        from onedal.decomposition import PCA as onedal_PCA
+
+        return onedal_PCA
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -27,9 +27,13 @@ from onedal.tests.utils._dataframes_support import (
 
 
 @pytest.mark.parametrize("dataframe,queue", get_dataframes_and_queues())
-def test_sklearnex_import(dataframe, queue):
+@pytest.mark.parametrize("svd_solver", ["full", "covariance_eigh"])
+def test_sklearnex_import(dataframe, queue, svd_solver):
     from sklearnex.decomposition import PCA
 
+    if svd_solver == "covariance_eigh" and not daal_check_version((2024, "P", 100)):
+        pytest.skip("'covariance_eigh' solver requires oneDAL >= 2024.1.0")
+
     X = [[-1, -1], [-2, -1], [-3, -2], [1, 1], [2, 1], [3, 2]]
     X = _convert_to_dataframe(X, sycl_queue=queue, target_df=dataframe)
     X_transformed_expected = [
@@ -41,10 +45,10 @@ def test_sklearnex_import(dataframe, queue):
         [3.6053038, 0.04224385],
     ]
 
-    pca = PCA(n_components=2, svd_solver="full")
+    pca = PCA(n_components=2, svd_solver=svd_solver)
     pca.fit(X)
     X_transformed = pca.transform(X)
-    X_fit_transformed = PCA(n_components=2, svd_solver="full").fit_transform(X)
+    X_fit_transformed = PCA(n_components=2, svd_solver=svd_solver).fit_transform(X)
 
     if daal_check_version((2024, "P", 100)):
         assert "sklearnex" in pca.__module__
@@ -54,3 +58,66 @@ def test_sklearnex_import(dataframe, queue):
     assert_allclose([6.30061232, 0.54980396], _as_numpy(pca.singular_values_))
     assert_allclose(X_transformed_expected, _as_numpy(X_transformed))
     assert_allclose(X_transformed_expected, _as_numpy(X_fit_transformed))
+
+
+def test_covariance_eigh_sklearn_fallback():
+    from sklearnex.decomposition import PCA
+
+    if not daal_check_version((2024, "P", 100)):
+        pytest.skip("'covariance_eigh' solver requires oneDAL >= 2024.1.0")
+
+    # wide data fails the oneDAL shape check, so the fit must fall back to
+    # sklearn, where the solver is mapped to the equivalent 'full' one
+    X = np.random.RandomState(42).rand(3, 10)
+    pca = PCA(n_components=2, svd_solver="covariance_eigh").fit(X)
+
+    assert not hasattr(pca, "_onedal_estimator")
+    assert pca.n_components_ == 2
+    assert pca.transform(X).shape == (3, 2)
+
+
+def test_randomized_solver_onedal_dispatch():
+    from sklearnex.decomposition import PCA
+
+    if not daal_check_version((2024, "P", 100)):
+        pytest.skip("sklearnex PCA requires oneDAL >= 2024.1.0")
+
+    # tall-and-skinny data with integer n_components dispatches to oneDAL,
+    # which returns the exact leading components
+    X = np.random.RandomState(42).rand(200, 5)
+    pca = PCA(n_components=2, svd_solver="randomized").fit(X)
+    expected = PCA(n_components=2, svd_solver="full").fit(X)
+
+    assert hasattr(pca, "_onedal_estimator")
+    assert_allclose(pca.explained_variance_, expected.explained_variance_)
+    assert_allclose(pca.components_, expected.components_)
+
+    # shapes that are not tall-and-skinny keep the sklearn randomized solver
+    X_square = np.random.RandomState(42).rand(40, 5)
+    pca_fallback = PCA(n_components=2, svd_solver="randomized").fit(X_square)
+    assert not hasattr(pca_fallback, "_onedal_estimator")
+
+    # non-integer n_components is not redirected either: sklearn's
+    # randomized solver rejects it, which proves the fallback was taken
+    with pytest.raises(ValueError):
+        PCA(n_components=0.5, svd_solver="randomized").fit(X)
+
+
+@pytest.mark.parametrize("whiten", [False, True])
+@pytest.mark.parametrize("n_components", [2, None])
+def test_get_precision_against_sklearn(whiten, n_components):
+    from sklearn.decomposition import PCA as sklearn_PCA
+
+    from sklearnex.decomposition import PCA
+
+    if not daal_check_version((2024, "P", 100)):
+        pytest.skip("sklearnex PCA requires oneDAL >= 2024.1.0")
+
+    # n_components=None keeps full rank and exercises the analytic fast
+    # path; n_components=2 exercises the matrix-inversion-lemma branch
+    X = np.random.RandomState(42).rand(30, 4)
+    params = {"n_components": n_components, "whiten": whiten, "svd_solver": "full"}
+    precision = PCA(**params).fit(X).get_precision()
+    expected = sklearn_PCA(**params).fit(X).get_precision()
+
+    assert_allclose(precision, expected, rtol=1e-5, atol=1e-8)
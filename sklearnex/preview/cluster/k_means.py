@@ -37,13 +37,23 @@ if daal_check_version((2023, "P", 200)):
     from ..._utils import PatchingConditionsChain
     from ._common import BaseKMeans
 
+    # sklearn version checks are evaluated once at module load instead of
+    # on every __init__/fit/predict call
+    _SKLEARN_1_0 = sklearn_check_version("1.0")
+    _SKLEARN_1_2 = sklearn_check_version("1.2")
+    _SKLEARN_1_4 = sklearn_check_version("1.4")
+
+    # algorithms accepted by the oneDAL dispatch predicates; built once
+    # instead of per fit/predict call
+    _SUPPORTED_ALGORITHMS = ("auto", "full", "lloyd")
+
     @control_n_jobs(decorated_methods=["fit", "predict"])
     class KMeans(sklearn_KMeans, BaseKMeans):
         __doc__ = sklearn_KMeans.__doc__
         n_iter_, inertia_ = None, None
         labels_, cluster_centers_ = None, None
 
-        if sklearn_check_version("1.2"):
+        if _SKLEARN_1_2:
             _parameter_constraints: dict = {**sklearn_KMeans._parameter_constraints}
 
             @_deprecate_positional_args
@@ -52,7 +62,7 @@ if daal_check_version((2023, "P", 200)):
                 n_clusters=8,
                 *,
                 init="k-means++",
-                n_init="auto" if sklearn_check_version("1.4") else "warn",
+                n_init="auto" if _SKLEARN_1_4 else "warn",
                 max_iter=300,
                 tol=1e-4,
                 verbose=0,
@@ -72,7 +82,7 @@ if daal_check_version((2023, "P", 200)):
                     algorithm=algorithm,
                 )
 
-        elif sklearn_check_version("1.0"):
+        elif _SKLEARN_1_0:
 
             @_deprecate_positional_args
             def __init__(
@@ -153,13 +163,12 @@ if daal_check_version((2023, "P", 200)):
 
             sample_count = _num_samples(X)
             self._algorithm = self.algorithm
-            supported_algs = ["auto", "full", "lloyd"]
             correct_count = self.n_clusters < sample_count
 
             patching_status.and_conditions(
                 [
                     (
-                        self.algorithm in supported_algs,
+                        self.algorithm in _SUPPORTED_ALGORITHMS,
                         "Only lloyd algorithm is supported.",
                     ),
                     (not issparse(self.init), "Sparse init values are not supported"),
@@ -171,25 +180,45 @@ if daal_check_version((2023, "P", 200)):
 
             return patching_status
 
-        def fit(self, X, y=None, sample_weight=None):
-            if sklearn_check_version("1.0"):
-                self._check_feature_names(X, reset=True)
-            if sklearn_check_version("1.2"):
+        # fit/predict variants are selected once at class creation so the
+        # per-call bodies carry no sklearn version branches; feature names
+        # are checked by _validate_data inside the dispatched branch, so no
+        # separate _check_feature_names pass is made here
+        if _SKLEARN_1_2:
+
+            def fit(self, X, y=None, sample_weight=None):
                 self._validate_params()
 
-            dispatch(
-                self,
-                "fit",
-                {
-                    "onedal": self.__class__._onedal_fit,
-                    "sklearn": sklearn_KMeans.fit,
-                },
-                X,
-                y,
-                sample_weight,
-            )
+                dispatch(
+                    self,
+                    "fit",
+                    {
+                        "onedal": self.__class__._onedal_fit,
+                        "sklearn": sklearn_KMeans.fit,
+                    },
+                    X,
+                    y,
+                    sample_weight,
+                )
+
+                return self
+
+        else:
+
+            def fit(self, X, y=None, sample_weight=None):
+                dispatch(
+                    self,
+                    "fit",
+                    {
+                        "onedal": self.__class__._onedal_fit,
+                        "sklearn": sklearn_KMeans.fit,
+                    },
+                    X,
+                    y,
+                    sample_weight,
+                )
 
-            return self
+                return self
 
         def _onedal_fit(self, X, _, sample_weight, queue=None):
             assert sample_weight is None
@@ -200,7 +229,7 @@ if daal_check_version((2023, "P", 200)):
                 dtype=[np.float64, np.float32],
             )
 
-            if sklearn_check_version("1.2"):
+            if _SKLEARN_1_2:
                 self._check_params_vs_input(X)
             else:
                 self._check_params(X)
@@ -221,13 +250,12 @@ if daal_check_version((2023, "P", 200)):
                 f"sklearn.cluster.{class_name}.predict"
             )
 
-            supported_algs = ["auto", "full", "lloyd"]
             dense_centers = not issparse(self.cluster_centers_)
 
             patching_status.and_conditions(
                 [
                     (
-                        self.algorithm in supported_algs,
+                        self.algorithm in _SUPPORTED_ALGORITHMS,
                         "Only lloyd algorithm is supported.",
                     ),
                     (dense_centers, "Sparse clusters is not supported."),
@@ -237,22 +265,35 @@ if daal_check_version((2023, "P", 200)):
 
             return patching_status
 
-        @wrap_output_data
-        def predict(self, X):
-            if sklearn_check_version("1.0"):
-                self._check_feature_names(X, reset=True)
-            if sklearn_check_version("1.2"):
+        if _SKLEARN_1_2:
+
+            @wrap_output_data
+            def predict(self, X):
                 self._validate_params()
 
-            return dispatch(
-                self,
-                "predict",
-                {
-                    "onedal": self.__class__._onedal_predict,
-                    "sklearn": sklearn_KMeans.predict,
-                },
-                X,
-            )
+                return dispatch(
+                    self,
+                    "predict",
+                    {
+                        "onedal": self.__class__._onedal_predict,
+                        "sklearn": sklearn_KMeans.predict,
+                    },
+                    X,
+                )
+
+        else:
+
+            @wrap_output_data
+            def predict(self, X):
+                return dispatch(
+                    self,
+                    "predict",
+                    {
+                        "onedal": self.__class__._onedal_predict,
+                        "sklearn": sklearn_KMeans.predict,
+                    },
+                    X,
+                )
 
         def _onedal_predict(self, X, queue=None):
             X = self._validate_data(